@@ -28,8 +28,9 @@ class ManagedRegion:
     "schema drives part of a user file" need, not just contexts.
     """
 
-    _OPEN = r"//!\s*etask:managed\s+{name}\b"
-    _CLOSE = r"//!\s*etask:end\s+{name}\b"
+    # Open (``managed``) and close (``end``) markers share one pattern, so the
+    # region is located in a single pass over the file.
+    _MARKER = r"//!\s*etask:(?P<tag>managed|end)\s+{name}\b"
     _ITEM = re.compile(r"//!\s*etask:item\s+(\S+)\s*$")
 
     @staticmethod
@@ -50,10 +51,19 @@ class ManagedRegion:
         newline = "\n"
         lines = text.split(newline)
 
-        open_re = re.compile(ManagedRegion._OPEN.format(name=re.escape(name)))
-        close_re = re.compile(ManagedRegion._CLOSE.format(name=re.escape(name)))
-        open_i = next((i for i, ln in enumerate(lines) if open_re.search(ln)), None)
-        close_i = next((i for i, ln in enumerate(lines) if close_re.search(ln)), None)
+        marker_re = re.compile(ManagedRegion._MARKER.format(name=re.escape(name)))
+        open_i = close_i = None
+        for i, ln in enumerate(lines):
+            m = marker_re.search(ln)
+            if m is None:
+                continue
+            tag = m.group("tag")
+            if tag == "managed" and open_i is None:
+                open_i = i
+            elif tag == "end" and close_i is None:
+                close_i = i
+            if open_i is not None and close_i is not None:
+                break
         if open_i is None or close_i is None or close_i <= open_i:
             raise ManagedRegionError(
                 f"managed region '{name}' not found (need '//! etask:managed {name}' "
@@ -4,7 +4,7 @@ import re
 
 import yaml
 
-from schemav2.tree import _SchemaLoader, Tree
+from schemav2.tree import _IDENTIFIER_RE, _SchemaLoader, Tree
 from schemav2.errors.rename_error import RenameError
 from schemav2.errors.invalid_identifier_error import InvalidIdentifierError
 from schemav2.codegen.naming import _ROOT_NAMESPACE
@@ -37,7 +37,7 @@ class Renamer:
 
     @staticmethod
     def __validate_new_name(new_name: str, task_path: str) -> None:
-        if not re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", new_name):
+        if not _IDENTIFIER_RE.match(new_name):
             raise InvalidIdentifierError(new_name, task_path, "must be a valid C++ identifier")
 
     @staticmethod
@@ -18,7 +18,6 @@ class TaskBaseFile:
     @staticmethod
     def render() -> str:
         guard = Naming.task_base_guard()
-        ns = Naming.root_namespace()
         lines = [
             "// SPDX-License-Identifier: MIT",
             "/**",
@@ -32,7 +31,7 @@ class TaskBaseFile:
             "* `global::task_id`.",
             "*",
             "* @note Generated once by etask, then owned by you. The `global::task_id`",
-            f"*       enum it binds to is generated from your schema (see",
+            "*       enum it binds to is generated from your schema (see",
             f"*       {Naming.task_id_include_from_root()}); this alias is not, and is never",
             "*       overwritten once it exists.",
             "*/",
@@ -46,7 +45,7 @@ class TaskBaseFile:
             "*",
             "* An `etask::core::task` specialized on this project's generated task id type.",
             "*/",
-            f"using task = etask::core::task<global::task_id>;",
+            "using task = etask::core::task<global::task_id>;",
             "",
             f"#endif // {guard}",
         ]
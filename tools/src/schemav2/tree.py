@@ -20,8 +20,12 @@ from schemav2.errors.abstract_instance_error import AbstractInstanceError
 _KINDS = {"scope": Kind.SCOPE, "abstract_scope": Kind.ABSTRACT_SCOPE, "task": Kind.TASK}
 _BOOL_RE = re.compile(r"^(?:true|True|TRUE|false|False|FALSE)$")
 
+# libyaml's C scanner/parser when PyYAML was built with it, else the pure-Python
+# one. Resolution stays in Python either way, so the override below applies to both.
+_BaseLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-class _SchemaLoader(yaml.SafeLoader):
+
+class _SchemaLoader(_BaseLoader):
     """SafeLoader with YAML-1.2 boolean semantics.
 
     PyYAML defaults to YAML 1.1, where ``on``/``off``/``yes``/``no`` resolve to
@@ -32,7 +36,7 @@ class _SchemaLoader(yaml.SafeLoader):
 
 _SchemaLoader.yaml_implicit_resolvers = {
     char: [(tag, regexp) for tag, regexp in mappers if tag != "tag:yaml.org,2002:bool"]
-    for char, mappers in yaml.SafeLoader.yaml_implicit_resolvers.items()
+    for char, mappers in _BaseLoader.yaml_implicit_resolvers.items()
 }
 _SchemaLoader.add_implicit_resolver("tag:yaml.org,2002:bool", _BOOL_RE, list("tTfF"))
 _IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
@@ -77,12 +81,14 @@ class Tree:
 
     @staticmethod
     def __load(schema_path: Path) -> Dict:
-        text = schema_path.read_text()
+        # One read of the raw bytes; both parsers detect the encoding themselves,
+        # so the result does not depend on the platform's locale.
+        raw = schema_path.read_bytes()
         if schema_path.suffix == ".json":
-            data = json.loads(text)
+            data = json.loads(raw)
         else:
             # YAML is a JSON superset, so this also parses .yaml/.yml and bare files.
-            data = yaml.load(text, Loader=_SchemaLoader)
+            data = yaml.load(raw, Loader=_SchemaLoader)
         if not isinstance(data, dict):
             raise SchemaShapeError("<root>", "top level must be a mapping of named nodes")
         return data
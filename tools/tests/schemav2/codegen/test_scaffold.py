@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: MIT
 # -*- coding: utf-8 -*-
 
-from schemav2.codegen.scaffold import Scaffold, ScaffoldReport
+from schemav2.codegen.scaffold import Scaffold
 
 _FILES = [
     "CMakeLists.txt",
@@ -0,0 +1,16 @@
+# tools/tests/schemav2/conftest.py
+# SPDX-License-Identifier: MIT
+# -*- coding: utf-8 -*-
+
+from pathlib import Path
+
+import pytest
+
+# tools/tests/schemav2/conftest.py -> repository root
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+@pytest.fixture(scope="session")
+def schema_dir():
+    """The repository's ``schema/`` directory: the meta-schema and the example schemas."""
+    return _REPO_ROOT / "schema"
@@ -10,13 +10,10 @@ import yaml
 
 from schemav2.tree import _SchemaLoader
 
-_SCHEMA_DIR = "/home/mark/Desktop/projects/elib/etask/schema"
-_META = f"{_SCHEMA_DIR}/meta/etask.schema.json"
-
 
 @pytest.fixture(scope="module")
-def validator():
-    meta = json.load(open(_META))
+def validator(schema_dir):
+    meta = json.load(open(schema_dir / "meta" / "etask.schema.json"))
     jsonschema.Draft202012Validator.check_schema(meta)
     return jsonschema.Draft202012Validator(meta)
 
@@ -25,13 +22,13 @@ def test_meta_schema_is_valid(validator):
     assert validator is not None
 
 
-def test_example_json_validates(validator):
-    data = json.load(open(f"{_SCHEMA_DIR}/schema.json"))
+def test_example_json_validates(validator, schema_dir):
+    data = json.load(open(schema_dir / "schema.json"))
     assert list(validator.iter_errors(data)) == []
 
 
-def test_example_yaml_validates(validator):
-    data = yaml.load(open(f"{_SCHEMA_DIR}/schema.yaml").read(), Loader=_SchemaLoader)
+def test_example_yaml_validates(validator, schema_dir):
+    data = yaml.load(open(schema_dir / "schema.yaml").read(), Loader=_SchemaLoader)
     assert list(validator.iter_errors(data)) == []
 
 
@@ -280,17 +280,15 @@ def test_top_level_must_be_mapping(tmp_path):
 # YAML vs JSON equivalence + real example
 # -----------------------
 
-def test_yaml_json_examples_equivalent():
-    root = "/home/mark/Desktop/projects/elib/etask/schema"
-
+def test_yaml_json_examples_equivalent(schema_dir):
     def sig(node):
         return (node.name, node.kind.value, node.uid,
                 tuple((p.name, p.type) for p in (node.params or [])),
                 tuple((p.name, p.type) for p in (node.returns or [])),
                 tuple(sig(c) for c in node.children.values()))
 
-    y = Tree.build(f"{root}/schema.yaml")
-    j = Tree.build(f"{root}/schema.json")
+    y = Tree.build(schema_dir / "schema.yaml")
+    j = Tree.build(schema_dir / "schema.json")
     assert sig(y) == sig(j)
     assert y.uid_bytes == 1
     # 4 legs * (1 calibrate + 2 muscles * 2 motors * 2 tasks) + 1 reboot
@@ -316,39 +314,33 @@ def test_on_off_not_coerced_to_bool_in_yaml(tmp_path):
     assert set(root.children["motor"].children) == {"on", "off"}
 
 
-def test_concurrency_parsed_onto_task():
-    import tempfile, pathlib
-    y = "mover:\n  type: task\n  concurrency: 4\nsolo:\n  type: task\n"
-    p = pathlib.Path(tempfile.mktemp(suffix=".yaml")); p.write_text(y)
+def test_concurrency_parsed_onto_task(tmp_path):
+    p = tmp_path / "schema.yaml"
+    p.write_text("mover:\n  type: task\n  concurrency: 4\nsolo:\n  type: task\n")
     root = Tree.build(p)
     assert root.children["mover"].concurrency == 4
     assert root.children["solo"].concurrency is None   # default
 
 
-def test_concurrency_must_be_positive_int():
-    import tempfile, pathlib, pytest
-    from schemav2.errors.schema_shape_error import SchemaShapeError
+def test_concurrency_must_be_positive_int(tmp_path):
+    p = tmp_path / "schema.yaml"
     for bad in ("0", "-1", "true", "1.5"):
-        p = pathlib.Path(tempfile.mktemp(suffix=".yaml"))
         p.write_text(f"t:\n  type: task\n  concurrency: {bad}\n")
         with pytest.raises(SchemaShapeError):
             Tree.build(p)
 
 
-def test_concurrency_rejected_on_scope():
-    import tempfile, pathlib, pytest
-    from schemav2.errors.schema_shape_error import SchemaShapeError
-    p = pathlib.Path(tempfile.mktemp(suffix=".yaml"))
+def test_concurrency_rejected_on_scope(tmp_path):
+    p = tmp_path / "schema.yaml"
     p.write_text("s:\n  type: scope\n  concurrency: 2\n  children: {}\n")
     with pytest.raises(SchemaShapeError):
         Tree.build(p)
 
 
-def test_concurrency_copied_to_abstract_instances():
-    import tempfile, pathlib
-    y = ("joint:\n  type: abstract_scope\n  instances: [base, elbow]\n  children:\n"
-         "    move:\n      type: task\n      concurrency: 2\n")
-    p = pathlib.Path(tempfile.mktemp(suffix=".yaml")); p.write_text(y)
+def test_concurrency_copied_to_abstract_instances(tmp_path):
+    p = tmp_path / "schema.yaml"
+    p.write_text("joint:\n  type: abstract_scope\n  instances: [base, elbow]\n  children:\n"
+                 "    move:\n      type: task\n      concurrency: 2\n")
     root = Tree.build(p)
     assert root.children["base"].children["move"].concurrency == 2
     assert root.children["elbow"].children["move"].concurrency == 2